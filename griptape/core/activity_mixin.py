@@ -1,4 +1,5 @@
 import inspect
+from functools import lru_cache
 from typing import Optional
 from attr import define, field
 from jinja2 import Template
@@ -61,10 +62,13 @@ class ActivityMixin:
         if activity is None or not getattr(activity, "is_activity", False):
             raise Exception("This method is not an activity.")
         elif activity.config["schema"]:
-            full_schema = {
-                "values": activity.config["schema"].schema if activity.config["schema"] else {}
-            }
-
-            return Schema(full_schema).json_schema("InputSchema")
+            return self._activity_json_schema(activity.config["schema"])
         else:
             return None
+
+    # Activity schemas are defined once per activity method, so their JSON schema translation can be reused across
+    # calls and tool instances.
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _activity_json_schema(activity_schema: Schema) -> dict:
+        return Schema({"values": activity_schema.schema}).json_schema("InputSchema")
@@ -1,20 +1,38 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from attr import define, field
+from griptape import utils
 from griptape.artifacts import TextArtifact
 from griptape.core import ExponentialBackoffMixin
+from griptape.utils import QueryCache
 
 
 @define
 class BaseEmbeddingDriver(ExponentialBackoffMixin, ABC):
     dimensions: int = field(kw_only=True)
+    cache: Optional[QueryCache] = field(default=None, kw_only=True)
 
     def embed_text_artifact(self, artifact: TextArtifact) -> list[float]:
         return self.embed_string(artifact.to_text())
 
     def embed_string(self, string: str) -> list[float]:
+        if self.cache:
+            # Key on a hash so that long strings don't stay in memory as cache keys.
+            cache_key = utils.str_to_hash(string)
+            embedding = self.cache.get(cache_key)
+
+            # Return copies so that callers modifying their embedding don't change the cached one.
+            if embedding is not None:
+                return list(embedding)
+
         for attempt in self.retrying():
             with attempt:
-                return self.try_embed_string(string)
+                embedding = self.try_embed_string(string)
+
+        if self.cache:
+            self.cache.set(cache_key, list(embedding))
+
+        return embedding
 
     @abstractmethod
     def try_embed_string(self, string: str) -> list[float]:
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 if TYPE_CHECKING:
-    from griptape.memory.structure import ConversationMemory
+    from griptape.memory.structure import ConversationMemory, Run
 
 
 class BaseConversationMemoryDriver(ABC):
@@ -11,6 +11,12 @@ class BaseConversationMemoryDriver(ABC):
     def store(self, *args, **kwargs) -> None:
         ...
 
+    # Called with the newly added run after ConversationMemory.add_run() when that run is the only change to the
+    # memory. Drivers that can persist runs incrementally can override this instead of rewriting the whole memory.
+    # Memories whose add_run() also changes other state, like evicted runs or summaries, call store() instead.
+    def append(self, run: Run, memory: ConversationMemory) -> None:
+        self.store(memory)
+
     @abstractmethod
     def load(self, *args, **kwargs) -> ConversationMemory:
         ...
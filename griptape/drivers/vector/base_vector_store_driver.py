@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
 from concurrent import futures
-from dataclasses import dataclass
 from typing import Optional
 from attr import define, field, Factory
 from griptape import utils
@@ -12,19 +11,20 @@ from griptape.drivers import BaseEmbeddingDriver, OpenAiEmbeddingDriver
 class BaseVectorStoreDriver(ABC):
     DEFAULT_QUERY_COUNT = 5
 
-    @dataclass
+    # Drivers can return thousands of these per call, so they are slotted attrs classes rather than dataclasses.
+    @define
     class QueryResult:
-        vector: list[float]
-        score: float
-        meta: Optional[dict] = None
-        namespace: Optional[str] = None
+        vector: list[float] = field()
+        score: float = field()
+        meta: Optional[dict] = field(default=None)
+        namespace: Optional[str] = field(default=None)
 
-    @dataclass
+    @define
     class Entry:
-        id: str
-        vector: list[float]
-        meta: Optional[dict] = None
-        namespace: Optional[str] = None
+        id: str = field()
+        vector: list[float] = field()
+        meta: Optional[dict] = field(default=None)
+        namespace: Optional[str] = field(default=None)
 
     embedding_driver: BaseEmbeddingDriver = field(
         default=Factory(lambda: OpenAiEmbeddingDriver()),
@@ -117,3 +117,18 @@ class BaseVectorStoreDriver(ABC):
             **kwargs
     ) -> list[QueryResult]:
         ...
+
+    def batch_query(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            **kwargs
+    ) -> list[list[QueryResult]]:
+        return list(
+            self.futures_executor.map(
+                lambda q: self.query(q, count=count, namespace=namespace, include_vectors=include_vectors, **kwargs),
+                queries
+            )
+        )
@@ -1,20 +1,81 @@
-from typing import Optional
-from griptape import utils
+from __future__ import annotations
+import json
+from concurrent import futures
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
 from griptape.drivers import BaseVectorStoreDriver
-import marqo
+from griptape.utils import QueryCache
 from attr import define, field
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3 import Retry
+
+if TYPE_CHECKING:
+    import marqo
 
 
 @define
 class MarqoVectorStoreDriver(BaseVectorStoreDriver):
+    LOAD_ENTRIES_PAGE_SIZE = 1000
+    MAX_RETRIEVABLE_DOCS = 10000
+    BULK_SEARCH_UNSUPPORTED_STATUS_CODES = [404, 405, 501]
+    # Marqo's own errors carry a specific code; a server without the bulk route returns a generic error body.
+    BULK_SEARCH_UNSUPPORTED_ERROR_CODE = "unhandled_error"
+    # Index.search() parameter names and their counterparts in bulk search query bodies.
+    BULK_SEARCH_PARAMS = {
+        "searchable_attributes": "searchableAttributes",
+        "search_method": "searchMethod",
+        "limit": "limit",
+        "offset": "offset",
+        "show_highlights": "showHighlights",
+        "reranker": "reRanker",
+        "filter_string": "filter",
+        "attributes_to_retrieve": "attributesToRetrieve",
+        "boost": "boost",
+        "image_download_headers": "image_download_headers",
+        "context": "context",
+        "score_modifiers": "scoreModifiers",
+        "model_auth": "modelAuth"
+    }
+
     api_key: str = field(kw_only=True)
     url: str = field(kw_only=True)
-    mq: marqo.Client = field(kw_only=True)
-    index: str = field(kw_only=True)
+    index_name: str = field(kw_only=True)
+    client_batch_size: Optional[int] = field(default=None, kw_only=True)
+    cache: Optional[QueryCache] = field(default=None, kw_only=True)
+    pool_size: int = field(default=16, kw_only=True)
+    search_executor: Optional[futures.Executor] = field(default=None, kw_only=True)
+    session: Session = field(init=False)
+    mq: marqo.Client = field(init=False)
+    index: marqo.index.Index = field(init=False)
+    _search_executor_lock: Lock = field(factory=Lock, init=False)
 
     def __attrs_post_init__(self):
-        self.mq = marqo.Client(self.url, self.api_key)
-        self.mq.index("")
+        import marqo
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=Retry(total=3, backoff_factor=0.1)
+        )
+
+        self.session = Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.mq = marqo.Client(self.url, api_key=self.api_key)
+        self.index = self.mq.index(self.index_name)
+
+        # Marqo routes every request through a module-level session sized for 10 connections; use our own pool
+        # instead so that concurrent queries don't have to open new connections.
+        for http in [self.mq.http, self.index.http]:
+            http._operation = lambda method: getattr(self.session, method)
+
+    def close(self) -> None:
+        if self.search_executor:
+            self.search_executor.shutdown()
+
+        self.session.close()
 
     def upsert_text(
             self,
@@ -24,7 +85,44 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             meta: Optional[dict] = None,
             **kwargs
     ) -> str:
-        return self.index.add_documents([{"_id": vector_id, namespace: string}])
+        return self.upsert_texts([string], [vector_id], namespace, meta, **kwargs)[0]
+
+    def upsert_texts(
+            self,
+            strings: list[str],
+            vector_ids: Optional[list[Optional[str]]] = None,
+            namespace: Optional[str] = None,
+            meta: Optional[dict] = None,
+            **kwargs
+    ) -> list[str]:
+        if vector_ids and len(vector_ids) != len(strings):
+            raise ValueError("vector_ids must have the same length as strings")
+
+        vector_ids = vector_ids if vector_ids else [None] * len(strings)
+        documents = []
+
+        for string, vector_id in zip(strings, vector_ids):
+            document = {namespace: string} | (meta if meta else {})
+
+            if vector_id:
+                document["_id"] = vector_id
+
+            documents.append(document)
+
+        params = {
+            "client_batch_size": self.client_batch_size
+        } | kwargs
+
+        response = self.index.add_documents(documents, **params)
+
+        # Searches aren't scoped to a namespace, so any cached result can include documents from any namespace.
+        if self.cache:
+            self.cache.invalidate()
+
+        # When client_batch_size is set Marqo returns one response per batch.
+        responses = response if isinstance(response, list) else [response]
+
+        return [item["_id"] for r in responses for item in r["items"]]
 
     def load_entry(self, vector_id: str, namespace: Optional[str] = None) -> Optional[BaseVectorStoreDriver.Entry]:
         result = self.index.fetch(ids=[vector_id], namespace=namespace).to_dict()
@@ -43,31 +141,40 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             return None
 
     def load_entries(self, namespace: Optional[str] = None) -> list[BaseVectorStoreDriver.Entry]:
-        # This is a hacky way to query up to 10,000 values from Pinecone. Waiting on an official API for fetching
-        # all values from a namespace:
-        # https://community.pinecone.io/t/is-there-a-way-to-query-all-the-vectors-and-or-metadata-from-a-namespace/797/5
+        # Marqo can't page past MAX_RETRIEVABLE_DOCS (MARQO_MAX_RETRIEVABLE_DOCS on the server), so entries beyond
+        # that are not loaded.
+        entries = []
+        offset = 0
 
-        results = self.index.query(
-            self.embedding_driver.embed_string(""),
-            top_k=10000,
-            include_metadata=True,
-            namespace=namespace
-        )
+        while offset < self.MAX_RETRIEVABLE_DOCS:
+            limit = min(self.LOAD_ENTRIES_PAGE_SIZE, self.MAX_RETRIEVABLE_DOCS - offset)
+            hits = self.index.search(
+                "",
+                limit=limit,
+                offset=offset,
+                attributes_to_retrieve=["*"],
+                show_highlights=False
+            )["hits"]
 
-        results = self.index.search(
-            "",
-            limit=10000
-        )
+            namespace_hits = self._namespace_hits(hits, namespace)
+            vectors = self._fetch_vectors([h["_id"] for h in namespace_hits])
 
-        return [
-            BaseVectorStoreDriver.Entry(
-                id=r["id"],
-                vector=r["values"],
-                meta=r["metadata"],
-                namespace=results["namespace"]
+            entries.extend(
+                BaseVectorStoreDriver.Entry(
+                    id=h["_id"],
+                    vector=vectors.get(h["_id"], []),
+                    meta={k: v for k, v in h.items() if not k.startswith("_")},
+                    namespace=namespace
+                )
+                for h in namespace_hits
             )
-            for r in results["matches"]
-        ]
+
+            if len(hits) < limit:
+                break
+
+            offset += limit
+
+        return entries
 
     def query(
             self,
@@ -75,33 +182,100 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             count: Optional[int] = None,
             namespace: Optional[str] = None,
             include_vectors: bool = False,
-            # PineconeVectorStorageDriver-specific params:
+            # MarqoVectorStorageDriver-specific params:
             include_metadata=True,
             **kwargs
     ) -> list[BaseVectorStoreDriver.QueryResult]:
+        if self.cache:
+            cache_key = self._query_cache_key(query, count, namespace, include_vectors, include_metadata, **kwargs)
+            cached_results = self.cache.get(cache_key)
 
-        params = {
-            "limit": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
-            "attributes_to_retrieve": ["*"] if include_metadata else ["_id"]
-        } | kwargs
+            # Return copies so that callers reordering their results don't change the cached ones.
+            if cached_results is not None:
+                return list(cached_results)
 
-        results = self.index.search(query, **params)
+        query_results = self._search(query, count, namespace, include_vectors, include_metadata, **kwargs)
 
-        if include_vectors:
-            results = self.index.get_documents(list(map(lambda x: x["_id"], results)))
+        if self.cache:
+            self.cache.set(cache_key, list(query_results), namespace)
 
-        return [
-            BaseVectorStoreDriver.QueryResult(
-                vector=r["values"],
-                score=r["score"],
-                meta=r["metadata"],
-                namespace=results["namespace"]
-            )
-            for r in results["hits"]
+        return query_results
+
+    def batch_query(
+            self,
+            queries: list[str],
+            count: Optional[int] = None,
+            namespace: Optional[str] = None,
+            include_vectors: bool = False,
+            include_metadata=True,
+            **kwargs
+    ) -> list[list[BaseVectorStoreDriver.QueryResult]]:
+        from marqo.errors import MarqoWebError
+
+        query_results = [None] * len(queries)
+
+        if self.cache:
+            cache_keys = [
+                self._query_cache_key(q, count, namespace, include_vectors, include_metadata, **kwargs)
+                for q in queries
+            ]
+            query_results = [
+                list(cached_results) if (cached_results := self.cache.get(k)) is not None else None
+                for k in cache_keys
+            ]
+
+        pending = [i for i, r in enumerate(query_results) if r is None]
+
+        if not pending:
+            return query_results
+
+        bulk_params = self._bulk_search_params(kwargs)
+        bulk_queries = [
+            {
+                "index": self.index_name,
+                "q": queries[i],
+                "limit": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
+                "attributesToRetrieve": ["*"] if include_metadata else ["_id"],
+                "showHighlights": False
+            } | bulk_params
+            for i in pending
         ]
 
+        try:
+            results = self.mq.bulk_search(bulk_queries)["result"]
+        except MarqoWebError as e:
+            if not self._is_bulk_search_unsupported(e):
+                raise
+
+            results = None
+
+        if results is not None:
+            pending_hits = [self._namespace_hits(r["hits"], namespace) for r in results]
+            # Fetch the vectors of the whole batch in one request instead of one request per query.
+            vectors = self._fetch_vectors(
+                list(dict.fromkeys(h["_id"] for hits in pending_hits for h in hits))
+            ) if include_vectors else {}
+
+            pending_results = [self._hits_to_query_results(hits, namespace, vectors) for hits in pending_hits]
+        else:
+            # The bulk endpoint isn't available on this server, so overlap individual searches instead.
+            pending_results = list(
+                self._get_search_executor().map(
+                    lambda i: self._search(queries[i], count, namespace, include_vectors, include_metadata, **kwargs),
+                    pending
+                )
+            )
+
+        for i, result in zip(pending, pending_results):
+            query_results[i] = result
+
+            if self.cache:
+                self.cache.set(cache_keys[i], list(result), namespace)
+
+        return query_results
+
     def create_index(self, name: str, **kwargs) -> None:
-        mq.create_index(name, index_settings=kwargs)
+        self.mq.create_index(name, settings_dict=kwargs)
 
     def upsert_vector(
             self,
@@ -111,4 +285,82 @@ class MarqoVectorStoreDriver(BaseVectorStoreDriver):
             meta: Optional[dict] = None,
             **kwargs
     ) -> str:
-        raise Exception("not implemented")
\ No newline at end of file
+        raise Exception("not implemented")
+
+    def _get_search_executor(self) -> futures.Executor:
+        # Only servers without the bulk endpoint need the fallback searches, so their pool is created on first use.
+        with self._search_executor_lock:
+            if self.search_executor is None:
+                self.search_executor = futures.ThreadPoolExecutor(max_workers=self.pool_size)
+
+            return self.search_executor
+
+    def _query_cache_key(self, query: str, *args, **kwargs) -> tuple:
+        # kwargs can hold unhashable values like filter lists, so they are keyed by their JSON form.
+        return query, *args, json.dumps(kwargs, sort_keys=True, default=str)
+
+    def _is_bulk_search_unsupported(self, error: Exception) -> bool:
+        return (
+            getattr(error, "status_code", None) in self.BULK_SEARCH_UNSUPPORTED_STATUS_CODES
+            and getattr(error, "code", None) == self.BULK_SEARCH_UNSUPPORTED_ERROR_CODE
+        )
+
+    def _bulk_search_params(self, params: dict) -> dict:
+        unsupported_params = [name for name in params if name not in self.BULK_SEARCH_PARAMS]
+
+        if unsupported_params:
+            raise ValueError(f"unsupported bulk search parameters: {', '.join(unsupported_params)}")
+
+        return {self.BULK_SEARCH_PARAMS[name]: value for name, value in params.items()}
+
+    def _search(
+            self,
+            query: str,
+            count: Optional[int],
+            namespace: Optional[str],
+            include_vectors: bool,
+            include_metadata: bool,
+            **kwargs
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        params = {
+            "limit": count if count else BaseVectorStoreDriver.DEFAULT_QUERY_COUNT,
+            "attributes_to_retrieve": ["*"] if include_metadata else ["_id"],
+            "show_highlights": False
+        } | kwargs
+
+        hits = self._namespace_hits(self.index.search(query, **params)["hits"], namespace)
+        vectors = self._fetch_vectors([h["_id"] for h in hits]) if include_vectors else {}
+
+        return self._hits_to_query_results(hits, namespace, vectors)
+
+    def _namespace_hits(self, hits: list[dict], namespace: Optional[str]) -> list[dict]:
+        # Namespaces are document fields, so only documents that have the namespace field belong to it.
+        return [h for h in hits if namespace is None or namespace in h]
+
+    def _hits_to_query_results(
+            self,
+            hits: list[dict],
+            namespace: Optional[str],
+            vectors: dict[str, list[float]]
+    ) -> list[BaseVectorStoreDriver.QueryResult]:
+        return [
+            BaseVectorStoreDriver.QueryResult(
+                vector=vectors.get(h["_id"], []),
+                score=h["_score"],
+                meta={k: v for k, v in h.items() if not k.startswith("_")},
+                namespace=namespace
+            )
+            for h in hits
+        ]
+
+    def _fetch_vectors(self, vector_ids: list[str]) -> dict[str, list[float]]:
+        # Marqo search responses never include tensors, so vectors have to be fetched in a follow-up request.
+        if not vector_ids:
+            return {}
+
+        documents = self.index.get_documents(vector_ids, expose_facets=True)["results"]
+
+        return {
+            d["_id"]: d["_tensor_facets"][0]["_embedding"]
+            for d in documents if d.get("_tensor_facets")
+        }
@@ -15,12 +15,17 @@ class BufferConversationMemory(ConversationMemory):
         while len(self.runs) > self.buffer_size:
             self.runs.pop(0)
 
+    def after_add_run(self) -> None:
+        # Adding a run can evict older ones, so the driver stores the whole memory instead of appending the run.
+        if self.driver:
+            self.driver.store(self)
+
     def to_dict(self) -> dict:
-        return dict(BufferConversationMemorySchema().dump(self))
+        return dict(BufferConversationMemorySchema.shared().dump(self))
 
     @classmethod
     def from_dict(cls, memory_dict: dict) -> BufferConversationMemory:
-        return BufferConversationMemorySchema().load(memory_dict)
+        return BufferConversationMemorySchema.shared().load(memory_dict)
 
     @classmethod
     def from_json(cls, memory_json: str) -> BufferConversationMemory:
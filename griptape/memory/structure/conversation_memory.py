@@ -16,6 +16,7 @@ class ConversationMemory:
     driver: Optional[BaseConversationMemoryDriver] = field(default=None, kw_only=True)
     runs: list[Run] = field(factory=list, kw_only=True)
     structure: Structure = field(init=False)
+    _prompt_string_cache: Optional[tuple] = field(default=None, init=False, eq=False, repr=False)
 
     def add_run(self, run: Run) -> ConversationMemory:
         self.before_add_run()
@@ -32,29 +33,44 @@ class ConversationMemory:
 
     def after_add_run(self) -> None:
         if self.driver:
-            self.driver.store(self)
+            if self.runs:
+                self.driver.append(self.runs[-1], self)
+            else:
+                self.driver.store(self)
 
     def is_empty(self) -> bool:
         return not self.runs
 
     def to_prompt_string(self, last_n: Optional[int] = None) -> str:
-        return J2("prompts/memory/conversation.j2").render(
-            runs=self.runs if last_n is None else self.runs[-last_n:]
-        )
+        # Structures render memory on every step, usually without any runs added in between, so reuse the last
+        # rendered string for as long as the runs it was rendered from are unchanged.
+        cache_key = (last_n, len(self.runs), self.runs[-1].id if self.runs else None)
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2)
+        if self._prompt_string_cache is None or self._prompt_string_cache[0] != cache_key:
+            prompt_string = J2("prompts/memory/conversation.j2").render(
+                runs=self.runs if last_n is None else self.runs[max(0, len(self.runs) - last_n):]
+            )
+
+            self._prompt_string_cache = (cache_key, prompt_string)
+
+        return self._prompt_string_cache[1]
+
+    def to_json(self, pretty: bool = False) -> str:
+        if pretty:
+            return json.dumps(self.to_dict(), indent=2)
+        else:
+            return json.dumps(self.to_dict(), separators=(",", ":"))
 
     def to_dict(self) -> dict:
         from griptape.schemas import ConversationMemorySchema
 
-        return dict(ConversationMemorySchema().dump(self))
+        return dict(ConversationMemorySchema.shared().dump(self))
 
     @classmethod
     def from_dict(cls, memory_dict: dict) -> ConversationMemory:
         from griptape.schemas import ConversationMemorySchema
 
-        return ConversationMemorySchema().load(memory_dict)
+        return ConversationMemorySchema.shared().load(memory_dict)
 
     @classmethod
     def from_json(cls, memory_json: str) -> ConversationMemory:
@@ -26,14 +26,14 @@ class SummaryConversationMemory(ConversationMemory):
 
     @classmethod
     def from_dict(cls, memory_dict: dict) -> SummaryConversationMemory:
-        return SummaryConversationMemorySchema().load(memory_dict)
+        return SummaryConversationMemorySchema.shared().load(memory_dict)
 
     @classmethod
     def from_json(cls, memory_json: str) -> SummaryConversationMemory:
         return SummaryConversationMemory.from_dict(json.loads(memory_json))
 
     def to_dict(self) -> dict:
-        return dict(SummaryConversationMemorySchema().dump(self))
+        return dict(SummaryConversationMemorySchema.shared().dump(self))
 
     def unsummarized_runs(self, last_n: Optional[int] = None) -> list[Run]:
         summary_index_runs = self.runs[self.summary_index:]
@@ -58,6 +58,11 @@ class SummaryConversationMemory(ConversationMemory):
             self.summary = self.summarize_runs(self.summary, runs_to_summarize)
             self.summary_index = 1 + self.runs.index(runs_to_summarize[-1])
 
+    def after_add_run(self) -> None:
+        # Adding a run can update the summary, so the driver stores the whole memory instead of appending the run.
+        if self.driver:
+            self.driver.store(self)
+
     def to_prompt_string(self, last_n: Optional[int] = None):
         return J2("prompts/memory/summary.j2").render(
             summary=self.summary,
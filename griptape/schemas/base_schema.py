@@ -1,10 +1,18 @@
 from abc import abstractmethod
+from functools import lru_cache
 from marshmallow import Schema, fields
 
 
 class BaseSchema(Schema):
     schema_namespace = fields.Str(allow_none=True)
 
+    # Schema construction is relatively expensive in marshmallow, so hot paths should reuse one stateless instance per
+    # schema class.
+    @classmethod
+    @lru_cache(maxsize=None)
+    def shared(cls) -> "BaseSchema":
+        return cls()
+
     @abstractmethod
     def make_obj(self, data, **kwargs):
         ...
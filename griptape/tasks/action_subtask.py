@@ -1,11 +1,10 @@
 from __future__ import annotations
 import json
-import re
 from typing import TYPE_CHECKING, Optional
 import schema
 from attr import define, field
 from jsonschema.exceptions import ValidationError
-from jsonschema.validators import validate
+from jsonschema.validators import validate, validator_for
 from schema import Schema, Literal
 from griptape.artifacts import ErrorArtifact, TextArtifact
 from griptape.core import BaseTool, ActivityMixin
@@ -21,9 +20,15 @@ if TYPE_CHECKING:
 
 @define
 class ActionSubtask(PromptTask):
-    THOUGHT_PATTERN = r"^Thought:\s*(.*)$"
-    ACTION_PATTERN = r"^Action:\s*({.*})$"
-    OUTPUT_PATTERN = r"^Output:\s?([\s\S]*)$"
+    THOUGHT_PREFIX = "Thought:"
+    ACTION_PREFIX = "Action:"
+    OUTPUT_PREFIX = "Output:"
+    ACTION_JSON_KEYS = (
+        ("type", "action_type"),
+        ("name", "action_name"),
+        ("activity", "action_activity"),
+        ("input", "action_input")
+    )
     ACTION_SCHEMA = Schema(
         description="Actions have type, name, activity, and input value.",
         schema={
@@ -48,6 +53,11 @@ class ActionSubtask(PromptTask):
         }
     )
 
+    # validate() checks the schema and builds a new validator on every call. This schema never changes, so build
+    # the validator once. It gets the same ACTION_SCHEMA.schema dict that validate() did, so it accepts the same
+    # actions.
+    ACTION_SCHEMA_VALIDATOR = validator_for(ACTION_SCHEMA.schema)(ACTION_SCHEMA.schema)
+
     parent_task_id: Optional[str] = field(default=None, kw_only=True)
     thought: Optional[str] = field(default=None, kw_only=True)
     action_type: Optional[str] = field(default=None, kw_only=True)
@@ -120,21 +130,12 @@ class ActionSubtask(PromptTask):
         )
 
     def to_json(self) -> str:
-        json_dict = {}
-
-        if self.action_type:
-            json_dict["type"] = self.action_type
-
-        if self.action_name:
-            json_dict["name"] = self.action_name
-
-        if self.action_activity:
-            json_dict["activity"] = self.action_activity
-
-        if self.action_input:
-            json_dict["input"] = self.action_input
+        json_dict = {
+            key: value for key, attribute in self.ACTION_JSON_KEYS
+            if (value := getattr(self, attribute))
+        }
 
-        return json.dumps(json_dict)
+        return json.dumps(json_dict, separators=(",", ":"), ensure_ascii=False)
 
     def add_child(self, child: ActionSubtask) -> ActionSubtask:
         if child.id not in self.child_ids:
@@ -155,21 +156,22 @@ class ActionSubtask(PromptTask):
         return parent
 
     def __init_from_prompt(self, value: str) -> None:
-        thought_matches = re.findall(self.THOUGHT_PATTERN, value, re.MULTILINE)
-        action_matches = re.findall(self.ACTION_PATTERN, value, re.MULTILINE)
-        output_matches = re.findall(self.OUTPUT_PATTERN, value, re.MULTILINE)
+        thought, action, output = self.__parse_prompt(value)
 
-        if self.thought is None and len(thought_matches) > 0:
-            self.thought = thought_matches[-1]
+        if self.thought is None and thought is not None:
+            self.thought = thought
 
-        if len(action_matches) > 0:
+        if action is not None:
             try:
-                action_object: dict = json.loads(action_matches[-1])
+                try:
+                    action_object: dict = json.loads(action)
+                except json.JSONDecodeError:
+                    import ast
 
-                validate(
-                    instance=action_object,
-                    schema=self.ACTION_SCHEMA.schema
-                )
+                    # Some LLMs return Python-style dicts with single quotes instead of JSON.
+                    action_object: dict = ast.literal_eval(action)
+
+                self.ACTION_SCHEMA_VALIDATOR.validate(action_object)
 
                 # Load action type; throw exception if the key is not present
                 if self.action_type is None:
@@ -219,8 +221,42 @@ class ActionSubtask(PromptTask):
 
                 self.action_name = "error"
                 self.action_input = {"error": f"Action input parsing error: {e}"}
-        elif self.output is None and len(output_matches) > 0:
-            self.output = TextArtifact(output_matches[-1])
+        elif self.output is None and output is not None:
+            self.output = TextArtifact(output)
+
+    def __parse_prompt(self, value: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        # Scan the prompt once, keeping the last thought and action. Output runs from the first output line until the
+        # end of the prompt.
+        thought = action = output = None
+        offset = 0
+        lines = value.split("\n")
+
+        for i, line in enumerate(lines):
+            if line.startswith(self.THOUGHT_PREFIX):
+                thought = self.__prefixed_value(lines, i, self.THOUGHT_PREFIX)
+            elif line.startswith(self.ACTION_PREFIX):
+                action_value = self.__prefixed_value(lines, i, self.ACTION_PREFIX)
+
+                if action_value.startswith("{") and action_value.endswith("}"):
+                    action = action_value
+            elif output is None and line.startswith(self.OUTPUT_PREFIX):
+                output = value[offset + len(self.OUTPUT_PREFIX):]
+
+                if output[:1].isspace():
+                    output = output[1:]
+
+            offset += len(line) + 1
+
+        return thought, action, output
+
+    def __prefixed_value(self, lines: list[str], index: int, prefix: str) -> str:
+        # Values can start on the line after their prefix, so fall back to the next non-blank line.
+        value = lines[index][len(prefix):].lstrip()
+
+        if not value:
+            value = next((line.lstrip() for line in lines[index + 1:] if line.strip()), "")
+
+        return value
 
     def __validate_activity_mixin(self, mixin: ActivityMixin) -> None:
         try:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import json
 from typing import TYPE_CHECKING, Optional
-from attr import define, field
+from attr import define, field, Factory
 from griptape.tasks import ActionSubtask
 from griptape import utils
 from griptape.core import BaseTool
@@ -21,6 +21,10 @@ class ToolkitTask(PromptTask):
     tools: list[BaseTool] = field(factory=list, kw_only=True)
     max_subtasks: int = field(default=DEFAULT_MAX_STEPS, kw_only=True)
     _subtasks: list[ActionSubtask] = field(factory=list)
+    _subtasks_by_id: dict[str, ActionSubtask] = field(
+        default=Factory(lambda self: {s.id: s for s in self._subtasks}, takes_self=True),
+        init=False
+    )
 
     @tools.validator
     def validate_tools(self, _, tools: list[BaseTool]) -> None:
@@ -45,6 +49,7 @@ class ToolkitTask(PromptTask):
         from griptape.tasks import ActionSubtask
 
         self._subtasks.clear()
+        self._subtasks_by_id.clear()
 
         subtask = self.add_subtask(
             ActionSubtask(
@@ -85,7 +90,7 @@ class ToolkitTask(PromptTask):
         )
 
     def find_subtask(self, task_id: str) -> Optional[ActionSubtask]:
-        return next((subtask for subtask in self._subtasks if subtask.id == task_id), None)
+        return self._subtasks_by_id.get(task_id)
 
     def add_subtask(self, subtask: ActionSubtask) -> ActionSubtask:
         subtask.attach(self)
@@ -94,6 +99,7 @@ class ToolkitTask(PromptTask):
             self._subtasks[-1].add_child(subtask)
 
         self._subtasks.append(subtask)
+        self._subtasks_by_id[subtask.id] = subtask
 
         return subtask
 
@@ -9,6 +9,7 @@ from .command_runner import CommandRunner
 from .chat import Chat
 from .futures import execute_futures_dict
 from .token_counter import TokenCounter
+from .query_cache import QueryCache
 
 
 def minify_json(value: str) -> str:
@@ -25,5 +26,6 @@ __all__ = [
     "Chat",
     "str_to_hash",
     "execute_futures_dict",
-    "TokenCounter"
+    "TokenCounter",
+    "QueryCache"
 ]
@@ -1,6 +1,7 @@
+from functools import lru_cache
 from typing import Optional
 from attr import define, field, Factory
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from .paths import abs_path
 
 
@@ -10,18 +11,30 @@ class J2:
     templates_dir: str = field(default=abs_path("templates"), kw_only=True)
     environment: Environment = field(
         default=Factory(
-            lambda self: Environment(
-                loader=FileSystemLoader(self.templates_dir),
-                trim_blocks=True,
-                lstrip_blocks=True
-            ),
+            lambda self: J2.shared_environment(self.templates_dir),
             takes_self=True
         ),
         kw_only=True
     )
 
+    # Environments cache compiled templates, so share one per templates directory instead of re-reading and
+    # re-parsing templates for every J2 instance.
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def shared_environment(templates_dir: str) -> Environment:
+        return Environment(
+            loader=FileSystemLoader(templates_dir),
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def compile_string(environment: Environment, value: str) -> Template:
+        return environment.from_string(value)
+
     def render(self, **kwargs):
         return self.environment.get_template(self.template_name).render(kwargs)
 
     def render_from_string(self, value: str, **kwargs):
-        return self.environment.from_string(value).render(kwargs)
+        return self.compile_string(self.environment, value).render(kwargs)
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from threading import RLock
+from time import monotonic
+from typing import Any, Hashable, Optional
+from attr import define, field
+
+
+@define
+class QueryCache:
+    max_size: int = field(default=256, kw_only=True)
+    ttl: Optional[float] = field(default=300, kw_only=True)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    evictions: int = field(default=0, init=False)
+    _entries: OrderedDict = field(factory=OrderedDict, init=False)
+    _lock: RLock = field(factory=RLock, init=False)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+
+                return None
+
+            deadline, _, value = entry
+
+            if deadline is not None and deadline < monotonic():
+                del self._entries[key]
+
+                self.misses += 1
+
+                return None
+
+            self._entries.move_to_end(key)
+
+            self.hits += 1
+
+            return value
+
+    def set(self, key: Hashable, value: Any, namespace: Optional[str] = None) -> None:
+        deadline = monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (deadline, namespace, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+                self.evictions += 1
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                # Queries without a namespace span all namespaces, so they are stale as well.
+                stale_keys = [
+                    key for key, (_, entry_namespace, _) in self._entries.items()
+                    if entry_namespace is None or entry_namespace == namespace
+                ]
+
+                for key in stale_keys:
+                    del self._entries[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,18 @@
+from attr import define, field
+from griptape.drivers import BaseConversationMemoryDriver
+from griptape.memory.structure import ConversationMemory, Run
+
+
+@define
+class MockConversationMemoryDriver(BaseConversationMemoryDriver):
+    stored: list[ConversationMemory] = field(factory=list, kw_only=True)
+    appended: list[Run] = field(factory=list, kw_only=True)
+
+    def store(self, memory: ConversationMemory) -> None:
+        self.stored.append(memory)
+
+    def append(self, run: Run, memory: ConversationMemory) -> None:
+        self.appended.append(run)
+
+    def load(self) -> ConversationMemory:
+        return ConversationMemory()
@@ -1,5 +1,6 @@
 import pytest
 from griptape.artifacts import TextArtifact
+from griptape.utils import QueryCache
 from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
 
 
@@ -17,3 +18,22 @@ class TestBaseEmbeddingDriver:
         embedding = driver.embed_string("foobar")
 
         assert embedding == [0, 1]
+
+    def test_embed_string_with_cache(self, mocker):
+        driver = MockEmbeddingDriver(cache=QueryCache())
+        try_embed_string = mocker.spy(MockEmbeddingDriver, "try_embed_string")
+
+        assert driver.embed_string("foobar") == [0, 1]
+        assert driver.embed_string("foobar") == [0, 1]
+        assert driver.embed_string("foobaz") == [0, 1]
+
+        assert try_embed_string.call_count == 2
+        assert driver.cache.stats()["hits"] == 1
+
+    def test_embed_string_with_cache_returns_copies(self):
+        driver = MockEmbeddingDriver(cache=QueryCache())
+
+        driver.embed_string("foobar").append(2)
+        driver.embed_string("foobar").clear()
+
+        assert driver.embed_string("foobar") == [0, 1]
@@ -47,6 +47,19 @@ class TestLocalVectorStoreDriver:
         assert driver.query("foobar", include_vectors=True)[0].vector == [0, 1]
         assert BaseArtifact.from_json(driver.query("foobar")[0].meta["artifact"]).value == "foobar"
 
+    def test_batch_query(self, driver):
+        driver.upsert_text_artifact(
+            TextArtifact("foobar"),
+            namespace="test-namespace",
+        )
+
+        results = driver.batch_query(["foo", "bar"], namespace="test-namespace")
+
+        assert len(results) == 2
+        assert len(results[0]) == 1
+        assert len(results[1]) == 1
+        assert len(driver.batch_query(["foo", "bar"], namespace="bad-namespace")[1]) == 0
+
     def test_load_entry(self, driver):
         vector_id = driver.upsert_text_artifact(
             TextArtifact("foobar"),
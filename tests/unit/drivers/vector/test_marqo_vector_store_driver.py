@@ -0,0 +1,265 @@
+import sys
+import pytest
+from griptape.utils import QueryCache
+from tests.mocks.mock_embedding_driver import MockEmbeddingDriver
+
+
+class MockMarqoWebError(Exception):
+    def __init__(self, status_code: int, code: str):
+        super().__init__(code)
+
+        self.status_code = status_code
+        self.code = code
+
+
+class TestMarqoVectorStoreDriver:
+    @pytest.fixture
+    def marqo(self, mocker):
+        marqo = mocker.MagicMock()
+        marqo_errors = mocker.MagicMock(MarqoWebError=MockMarqoWebError)
+
+        mocker.patch.dict(sys.modules, {"marqo": marqo, "marqo.errors": marqo_errors})
+
+        return marqo
+
+    @pytest.fixture
+    def driver(self, marqo):
+        from griptape.drivers.vector.marqo_vector_store_driver import MarqoVectorStoreDriver
+
+        return MarqoVectorStoreDriver(
+            api_key="foobar",
+            url="http://localhost:8882",
+            index_name="test",
+            embedding_driver=MockEmbeddingDriver()
+        )
+
+    def hit(self, hit_id: str, score: float = 0.5, **fields) -> dict:
+        return {"_id": hit_id, "_score": score, "_highlights": {}} | fields
+
+    def test_init(self, driver, marqo):
+        marqo.Client.assert_called_once_with("http://localhost:8882", api_key="foobar")
+
+        assert driver.mq == marqo.Client.return_value
+        assert driver.index == driver.mq.index.return_value
+
+    def test_init_uses_session(self, driver):
+        assert driver.mq.http._operation("post") == driver.session.post
+        assert driver.index.http._operation("post") == driver.session.post
+        assert driver.index.http._operation("get") == driver.session.get
+
+    def test_upsert_text(self, driver):
+        driver.index.add_documents.return_value = {"items": [{"_id": "foo", "status": 200}]}
+
+        assert driver.upsert_text("foobar", vector_id="foo", namespace="test-namespace") == "foo"
+
+        driver.index.add_documents.assert_called_once_with(
+            [{"test-namespace": "foobar", "_id": "foo"}],
+            client_batch_size=None
+        )
+
+    def test_upsert_texts_batched(self, driver):
+        driver.client_batch_size = 1
+        driver.index.add_documents.return_value = [
+            {"items": [{"_id": "foo", "status": 200}]},
+            {"items": [{"_id": "bar", "status": 200}]}
+        ]
+
+        assert driver.upsert_texts(["foo text", "bar text"], namespace="test-namespace") == ["foo", "bar"]
+
+        driver.index.add_documents.assert_called_once_with(
+            [{"test-namespace": "foo text"}, {"test-namespace": "bar text"}],
+            client_batch_size=1
+        )
+
+    def test_upsert_texts_with_mismatched_ids(self, driver):
+        with pytest.raises(ValueError):
+            driver.upsert_texts(["foo text", "bar text"], vector_ids=["foo"])
+
+        driver.index.add_documents.assert_not_called()
+
+    def test_load_entries(self, driver, mocker):
+        mocker.patch.object(type(driver), "LOAD_ENTRIES_PAGE_SIZE", 2)
+        driver.index.search.side_effect = [
+            {"hits": [self.hit("foo", foo="foo text"), self.hit("bar", bar="bar text")]},
+            {"hits": [self.hit("baz", foo="baz text")]}
+        ]
+        driver.index.get_documents.side_effect = lambda ids, expose_facets: {
+            "results": [{"_id": i, "_tensor_facets": [{"_embedding": [0.1]}]} for i in ids]
+        }
+
+        entries = driver.load_entries("foo")
+
+        assert [e.id for e in entries] == ["foo", "baz"]
+        assert entries[0].vector == [0.1]
+        assert entries[0].meta == {"foo": "foo text"}
+        assert entries[0].namespace == "foo"
+        assert [c.kwargs["offset"] for c in driver.index.search.call_args_list] == [0, 2]
+
+    def test_load_entries_stops_at_max_retrievable_docs(self, driver, mocker):
+        mocker.patch.object(type(driver), "LOAD_ENTRIES_PAGE_SIZE", 2)
+        mocker.patch.object(type(driver), "MAX_RETRIEVABLE_DOCS", 3)
+        driver.index.search.side_effect = [
+            {"hits": [self.hit("foo"), self.hit("bar")]},
+            {"hits": [self.hit("baz")]}
+        ]
+        driver.index.get_documents.return_value = {"results": []}
+
+        assert len(driver.load_entries()) == 3
+        assert [c.kwargs["limit"] for c in driver.index.search.call_args_list] == [2, 1]
+
+    def test_query(self, driver):
+        driver.index.search.return_value = {"hits": [self.hit("foo", 0.9, text="foo text")]}
+
+        results = driver.query("foo", count=3)
+
+        assert len(results) == 1
+        assert results[0].score == 0.9
+        assert results[0].meta == {"text": "foo text"}
+        assert results[0].vector == []
+        assert driver.index.search.call_args.kwargs["limit"] == 3
+
+    def test_query_with_namespace(self, driver):
+        driver.index.search.return_value = {"hits": [self.hit("foo", foo="foo text"), self.hit("bar", bar="bar text")]}
+
+        results = driver.query("foo", namespace="foo")
+
+        assert [r.meta for r in results] == [{"foo": "foo text"}]
+        assert results[0].namespace == "foo"
+
+    def test_query_with_cache(self, driver):
+        driver.cache = QueryCache()
+        driver.index.search.return_value = {"hits": [self.hit("foo")]}
+        driver.index.add_documents.return_value = {"items": [{"_id": "bar", "status": 200}]}
+
+        driver.query("foo", namespace="a")
+        driver.query("foo", namespace="a")
+
+        assert driver.index.search.call_count == 1
+        assert driver.cache.stats()["hits"] == 1
+
+        driver.upsert_text("bar", namespace="b")
+        driver.query("foo", namespace="a")
+
+        assert driver.index.search.call_count == 2
+
+    def test_query_with_cache_returns_copies(self, driver):
+        driver.cache = QueryCache()
+        driver.index.search.return_value = {"hits": [self.hit("foo"), self.hit("bar")]}
+
+        driver.query("foo").reverse()
+        driver.query("foo").clear()
+
+        assert len(driver.query("foo")) == 2
+        assert driver.batch_query(["foo"])[0] == driver.query("foo")
+        assert driver.index.search.call_count == 1
+
+    def test_query_with_vectors(self, driver):
+        driver.index.search.return_value = {"hits": [self.hit("foo")]}
+        driver.index.get_documents.return_value = {
+            "results": [{"_id": "foo", "_tensor_facets": [{"_embedding": [0.1, 0.2]}]}]
+        }
+
+        assert driver.query("foo", include_vectors=True)[0].vector == [0.1, 0.2]
+
+        driver.index.get_documents.assert_called_once_with(["foo"], expose_facets=True)
+
+    def test_batch_query(self, driver):
+        driver.mq.bulk_search.return_value = {
+            "result": [
+                {"hits": [self.hit("foo", 0.9)]},
+                {"hits": [self.hit("bar", 0.8), self.hit("baz", 0.7)]}
+            ]
+        }
+
+        results = driver.batch_query(["foo", "bar"], count=2, filter_string="text:foo")
+
+        assert [[r.score for r in query_results] for query_results in results] == [[0.9], [0.8, 0.7]]
+
+        bulk_queries = driver.mq.bulk_search.call_args.args[0]
+
+        assert [q["q"] for q in bulk_queries] == ["foo", "bar"]
+        assert bulk_queries[0]["index"] == "test"
+        assert bulk_queries[0]["limit"] == 2
+        assert bulk_queries[0]["filter"] == "text:foo"
+        assert "filter_string" not in bulk_queries[0]
+
+    def test_batch_query_with_namespace(self, driver):
+        driver.mq.bulk_search.return_value = {
+            "result": [
+                {"hits": [self.hit("foo", foo="foo text"), self.hit("bar", bar="bar text")]},
+                {"hits": [self.hit("bar", bar="bar text")]}
+            ]
+        }
+
+        results = driver.batch_query(["foo", "bar"], namespace="foo")
+
+        assert [[r.meta for r in query_results] for query_results in results] == [[{"foo": "foo text"}], []]
+
+    def test_batch_query_with_vectors(self, driver):
+        driver.mq.bulk_search.return_value = {
+            "result": [
+                {"hits": [self.hit("foo")]},
+                {"hits": [self.hit("bar"), self.hit("foo")]}
+            ]
+        }
+        driver.index.get_documents.return_value = {
+            "results": [
+                {"_id": "foo", "_tensor_facets": [{"_embedding": [0.1]}]},
+                {"_id": "bar", "_tensor_facets": [{"_embedding": [0.2]}]}
+            ]
+        }
+
+        results = driver.batch_query(["foo", "bar"], include_vectors=True)
+
+        assert [[r.vector for r in query_results] for query_results in results] == [[[0.1]], [[0.2], [0.1]]]
+
+        driver.index.get_documents.assert_called_once_with(["foo", "bar"], expose_facets=True)
+
+    def test_batch_query_with_cache(self, driver):
+        driver.cache = QueryCache()
+        driver.index.search.return_value = {"hits": [self.hit("foo", 0.9)]}
+        driver.mq.bulk_search.return_value = {"result": [{"hits": [self.hit("bar", 0.8)]}]}
+
+        driver.query("foo")
+        results = driver.batch_query(["foo", "bar"])
+
+        assert [[r.score for r in query_results] for query_results in results] == [[0.9], [0.8]]
+        assert [q["q"] for q in driver.mq.bulk_search.call_args.args[0]] == ["bar"]
+
+    def test_batch_query_without_bulk_search(self, driver):
+        driver.mq.bulk_search.side_effect = MockMarqoWebError(404, "unhandled_error")
+        driver.index.search.side_effect = lambda q, **kwargs: {"hits": [self.hit(q, filter=kwargs["filter_string"])]}
+
+        results = driver.batch_query(["foo", "bar"], filter_string="text:foo")
+
+        assert [[r.meta["filter"] for r in query_results] for query_results in results] == [["text:foo"]] * 2
+        assert driver.search_executor._max_workers == driver.pool_size
+
+    def test_search_executor_is_created_lazily(self, driver):
+        driver.mq.bulk_search.return_value = {"result": [{"hits": []}]}
+
+        driver.batch_query(["foo"])
+        driver.close()
+
+        assert driver.search_executor is None
+
+    def test_batch_query_with_missing_index(self, driver):
+        driver.mq.bulk_search.side_effect = MockMarqoWebError(404, "index_not_found")
+
+        with pytest.raises(MockMarqoWebError):
+            driver.batch_query(["foo", "bar"])
+
+        driver.index.search.assert_not_called()
+
+    def test_batch_query_with_missing_documents(self, driver):
+        driver.mq.bulk_search.return_value = {"result": [{"hits": [self.hit("foo")]}]}
+        driver.index.get_documents.side_effect = MockMarqoWebError(404, "unhandled_error")
+
+        with pytest.raises(MockMarqoWebError):
+            driver.batch_query(["foo"], include_vectors=True)
+
+        driver.index.search.assert_not_called()
+
+    def test_batch_query_with_unsupported_params(self, driver):
+        with pytest.raises(ValueError):
+            driver.batch_query(["foo"], device="cuda")
@@ -2,6 +2,7 @@ import json
 from griptape.tasks import PromptTask
 from griptape.structures import Pipeline
 from griptape.memory.structure import BufferConversationMemory, Run
+from tests.mocks.mock_conversation_memory_driver import MockConversationMemoryDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 
 
@@ -23,6 +24,17 @@ class TestBufferConversationMemory:
 
         assert len(pipeline.memory.runs) == 2
 
+    def test_add_run_with_appending_driver(self):
+        driver = MockConversationMemoryDriver()
+        memory = BufferConversationMemory(driver=driver, buffer_size=1)
+
+        memory.add_run(Run(input="foo", output="foo"))
+        memory.add_run(Run(input="bar", output="bar"))
+
+        assert driver.appended == []
+        assert driver.stored == [memory, memory]
+        assert [r.input for r in driver.stored[-1].runs] == ["bar"]
+
     def test_to_json(self):
         memory = BufferConversationMemory()
         memory.add_run(Run(input="foo", output="bar"))
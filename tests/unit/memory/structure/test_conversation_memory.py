@@ -1,5 +1,6 @@
 import json
 from griptape.memory.structure import ConversationMemory, Run
+from tests.mocks.mock_conversation_memory_driver import MockConversationMemoryDriver
 
 
 class TestConversationMemory:
@@ -20,6 +21,26 @@ class TestConversationMemory:
 
         assert memory.runs[0] == run
 
+    def test_add_run_appends_to_driver(self, mocker):
+        driver = mocker.Mock()
+        memory = ConversationMemory(driver=driver)
+        run = Run(input="test", output="test")
+
+        memory.add_run(run)
+
+        driver.append.assert_called_once_with(run, memory)
+
+    def test_add_run_with_appending_driver(self):
+        driver = MockConversationMemoryDriver()
+        memory = ConversationMemory(driver=driver)
+        runs = [Run(input="foo", output="foo"), Run(input="bar", output="bar")]
+
+        for run in runs:
+            memory.add_run(run)
+
+        assert driver.appended == runs
+        assert driver.stored == []
+
     def test_to_string(self):
         memory = ConversationMemory()
         run = Run(input="test", output="test")
@@ -28,6 +49,20 @@ class TestConversationMemory:
 
         assert "Input: test\nOutput: test" in memory.to_prompt_string()
 
+    def test_to_string_last_n(self):
+        memory = ConversationMemory()
+
+        memory.add_run(Run(input="foo", output="foo"))
+
+        assert "Input: foo" in memory.to_prompt_string(last_n=1)
+        assert "Input: foo" not in memory.to_prompt_string(last_n=0)
+
+        memory.add_run(Run(input="bar", output="bar"))
+
+        assert "Input: foo" not in memory.to_prompt_string(last_n=1)
+        assert "Input: bar" in memory.to_prompt_string(last_n=1)
+        assert "Input: foo" in memory.to_prompt_string()
+
     def test_to_json(self):
         memory = ConversationMemory()
         memory.add_run(Run(input="foo", output="bar"))
@@ -35,6 +70,14 @@ class TestConversationMemory:
         assert json.loads(memory.to_json())["type"] == "ConversationMemory"
         assert json.loads(memory.to_json())["runs"][0]["input"] == "foo"
 
+    def test_to_json_pretty(self):
+        memory = ConversationMemory()
+        memory.add_run(Run(input="foo", output="bar"))
+
+        assert "\n" not in memory.to_json()
+        assert "\n" in memory.to_json(pretty=True)
+        assert json.loads(memory.to_json(pretty=True)) == json.loads(memory.to_json())
+
     def test_to_dict(self):
         memory = ConversationMemory()
         memory.add_run(Run(input="foo", output="bar"))
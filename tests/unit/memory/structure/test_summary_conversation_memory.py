@@ -1,5 +1,6 @@
 import json
 from griptape.memory.structure import SummaryConversationMemory, Run
+from tests.mocks.mock_conversation_memory_driver import MockConversationMemoryDriver
 from tests.mocks.mock_prompt_driver import MockPromptDriver
 from griptape.tasks import PromptTask
 from griptape.structures import Pipeline
@@ -22,6 +23,17 @@ class TestSummaryConversationMemory:
 
         assert len(memory.unsummarized_runs()) == 1
 
+    def test_add_run_with_appending_driver(self):
+        driver = MockConversationMemoryDriver()
+        memory = SummaryConversationMemory(driver=driver, offset=1, prompt_driver=MockPromptDriver())
+
+        memory.add_run(Run(input="foo", output="foo"))
+        memory.add_run(Run(input="bar", output="bar"))
+
+        assert driver.appended == []
+        assert driver.stored == [memory, memory]
+        assert memory.summary_index == 1
+
     def test_after_run(self):
         memory = SummaryConversationMemory(offset=1, prompt_driver=MockPromptDriver())
 
@@ -19,6 +19,80 @@ class TestActionSubtask:
         assert json_dict["name"] == "test"
         assert json_dict["activity"] == "test action"
         assert json_dict["input"] == "test input"
+        assert subtask.to_json().startswith('{"type":"tool","name":"test","activity":"test action"')
+
+    def test_init_from_prompt(self):
+        valid_input = 'Thought: first thought\n' \
+                      'Thought: need to test\n' \
+                      'Action: {"type": "tool", "name": "test", "activity": "test action", "input": {}}\n' \
+                      'Observation: test observation'
+
+        task = ToolkitTask(tools=[])
+        Pipeline().add_task(task)
+        subtask = task.add_subtask(ActionSubtask(valid_input))
+
+        assert subtask.thought == "need to test"
+        assert subtask.action_type == "tool"
+        assert subtask.action_name == "test"
+        assert subtask.action_activity == "test action"
+        assert subtask.output is None
+
+    def test_init_from_prompt_with_python_dict_action(self):
+        valid_input = "Thought: need to test\n" \
+                      "Action: {'type': 'tool', 'name': 'test', 'activity': 'test action', 'input': {'foo': None}}"
+
+        task = ToolkitTask(tools=[])
+        Pipeline().add_task(task)
+        subtask = task.add_subtask(ActionSubtask(valid_input))
+
+        assert subtask.action_type == "tool"
+        assert subtask.action_name == "test"
+        assert subtask.action_activity == "test action"
+        assert subtask.action_input == {}
+
+    def test_init_from_prompt_with_action_on_next_line(self):
+        valid_input = 'Thought: need to test\n' \
+                      'Action:\n' \
+                      '\n' \
+                      '  {"type": "tool", "name": "test", "activity": "test action", "input": {}}'
+
+        task = ToolkitTask(tools=[])
+        Pipeline().add_task(task)
+        subtask = task.add_subtask(ActionSubtask(valid_input))
+
+        assert subtask.action_type == "tool"
+        assert subtask.action_name == "test"
+        assert subtask.action_activity == "test action"
+
+    def test_init_from_prompt_with_thought_on_next_line(self):
+        valid_input = 'Thought:\n' \
+                      'need to test\n' \
+                      'Action: {"type": "tool", "name": "test", "activity": "test action", "input": {}}'
+
+        task = ToolkitTask(tools=[])
+        Pipeline().add_task(task)
+        subtask = task.add_subtask(ActionSubtask(valid_input))
+
+        assert subtask.thought == "need to test"
+        assert subtask.action_name == "test"
+
+    def test_init_from_prompt_with_output(self):
+        valid_input = 'Thought: done testing\n' \
+                      'Output: test output\n' \
+                      'more output'
+
+        task = ToolkitTask(tools=[])
+        Pipeline().add_task(task)
+        subtask = task.add_subtask(ActionSubtask(valid_input))
+
+        assert subtask.thought == "done testing"
+        assert subtask.action_name is None
+        assert subtask.output.value == "test output\nmore output"
+
+    def test_to_json_non_ascii(self):
+        subtask = ActionSubtask(action_type="tool", action_name="test", action_input={"values": {"foo": "café"}})
+
+        assert subtask.to_json() == '{"type":"tool","name":"test","input":{"values":{"foo":"café"}}}'
 
     def test_input(self):
         assert ActionSubtask("{{ hello }}").input.value == "{{ hello }}"
@@ -0,0 +1,11 @@
+from griptape.utils import J2
+
+
+class TestJ2:
+    def test_shared_environment(self):
+        assert J2("prompts/run.j2").environment is J2("prompts/memory/conversation.j2").environment
+        assert J2(templates_dir="foo").environment is not J2().environment
+
+    def test_render_from_string(self):
+        assert J2().render_from_string("{{ foo }} bar", foo="baz") == "baz bar"
+        assert J2().render_from_string("{{ foo }} bar", foo="qux") == "qux bar"
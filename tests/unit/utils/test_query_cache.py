@@ -0,0 +1,51 @@
+from griptape.utils import QueryCache
+
+
+class TestQueryCache:
+    def test_get_and_set(self):
+        cache = QueryCache()
+
+        assert cache.get("foo") is None
+
+        cache.set("foo", ["bar"])
+
+        assert cache.get("foo") == ["bar"]
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_lru_eviction(self):
+        cache = QueryCache(max_size=2)
+
+        cache.set("foo", 1)
+        cache.set("bar", 2)
+        cache.get("foo")
+        cache.set("baz", 3)
+
+        assert cache.get("bar") is None
+        assert cache.get("foo") == 1
+        assert cache.get("baz") == 3
+        assert cache.evictions == 1
+
+    def test_ttl(self):
+        cache = QueryCache(ttl=-1)
+
+        cache.set("foo", 1)
+
+        assert cache.get("foo") is None
+        assert cache.stats()["size"] == 0
+
+    def test_invalidate(self):
+        cache = QueryCache()
+
+        cache.set("foo", 1, namespace="a")
+        cache.set("bar", 2, namespace="b")
+        cache.set("baz", 3)
+
+        cache.invalidate("a")
+
+        assert cache.get("foo") is None
+        assert cache.get("bar") == 2
+        assert cache.get("baz") is None
+
+        cache.invalidate()
+
+        assert cache.get("bar") is None